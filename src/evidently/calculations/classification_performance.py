@@ -277,11 +277,12 @@ def collect_plot_data(prediction_probas: pd.DataFrame) -> Boxes:
     uppers = []
     maxs = []
     for col in prediction_probas.columns:
-        mins.append(np.percentile(prediction_probas[col], 0))
-        lowers.append(np.percentile(prediction_probas[col], 25))
-        means.append(np.percentile(prediction_probas[col], 50))
-        uppers.append(np.percentile(prediction_probas[col], 75))
-        maxs.append(np.percentile(prediction_probas[col], 100))
+        col_min, col_lower, col_mean, col_upper, col_max = np.percentile(prediction_probas[col], [0, 25, 50, 75, 100])
+        mins.append(col_min)
+        lowers.append(col_lower)
+        means.append(col_mean)
+        uppers.append(col_upper)
+        maxs.append(col_max)
     res["mins"] = mins
     res["lowers"] = lowers
     res["means"] = means
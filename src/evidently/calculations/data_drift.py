@@ -235,13 +235,10 @@ def get_one_column_drift(
     elif column_type == ColumnType.Categorical:
         reference_counts = reference_data[column_name].value_counts(sort=False)
         current_counts = current_data[column_name].value_counts(sort=False)
-        keys = set(reference_counts.keys()).union(set(current_counts.keys()))
-
-        for key in keys:
-            if key not in reference_counts:
-                reference_counts.loc[key] = 0
-            if key not in current_counts:
-                current_counts.loc[key] = 0
+        keys = list(set(reference_counts.keys()).union(set(current_counts.keys())))
+        # fill absent categories in one step, adding them with .loc one by one re-allocates the series on every key
+        reference_counts = reference_counts.reindex(keys, fill_value=0)
+        current_counts = current_counts.reindex(keys, fill_value=0)
 
         reference_small_distribution = list(
             reversed(
@@ -6,6 +6,7 @@ from typing import Collection
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Sequence
 from typing import Tuple
 from typing import Union
 
@@ -672,6 +673,38 @@ def calculate_column_distribution(column: pd.Series, column_type: str) -> Column
     return distribution
 
 
+def calculate_quantiles(column: pd.Series, quantiles: Sequence[float]) -> List[float]:
+    """Calculate quantiles of a numeric column, skipping missing values.
+
+    Gives the same values as `pd.Series.quantile` with linear interpolation (up to float rounding),
+    but uses one `np.partition` call for all requested quantiles instead of a full percentile pass per quantile.
+    """
+    if any(not 0 <= quantile <= 1 for quantile in quantiles):
+        raise ValueError(f"Quantiles should be in the interval [0, 1], got {list(quantiles)}")
+
+    values = column.to_numpy(dtype=float, na_value=np.nan)
+    values = values[~np.isnan(values)]
+    size = len(values)
+
+    if size == 0:
+        return [np.nan for _ in quantiles]
+
+    positions = [quantile * (size - 1) for quantile in quantiles]
+    bounds = [(int(position), min(int(position) + 1, size - 1)) for position in positions]
+    partitioned = np.partition(values, sorted({index for bound in bounds for index in bound}))
+    result = []
+
+    for position, (lower_index, upper_index) in zip(positions, bounds):
+        lower = float(partitioned[lower_index])
+        upper = float(partitioned[upper_index])
+        fraction = position - lower_index
+        # numpy-style interpolation: keeps the value exact when fraction is close to 1
+        diff = upper - lower
+        result.append(upper - diff * (1 - fraction) if fraction >= 0.5 else lower + diff * fraction)
+
+    return result
+
+
 def get_corr_method(method: Optional[str], target_correlation: Optional[str] = None, pearson_default: bool = True):
     if method is not None:
         return method
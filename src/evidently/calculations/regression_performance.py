@@ -187,8 +187,7 @@ def error_with_quantiles(dataset, prediction_column, target_column, quantile: fl
     error = dataset[prediction_column] - dataset[target_column]
 
     # underperformance metrics
-    quantile_top = np.quantile(error, quantile)
-    quantile_other = np.quantile(error, 1 - quantile)
+    quantile_top, quantile_other = np.quantile(error, [quantile, 1 - quantile])
     return ErrorWithQuantiles(error, quantile_top, quantile_other)
 
 
@@ -26,12 +26,29 @@ from typing import Tuple
 
 import numpy as np
 import pandas as pd
-from scipy import stats
 
 from evidently.calculations.stattests.registry import StatTest
 from evidently.calculations.stattests.registry import register_stattest
 
 
+def _wasserstein_distance(reference_data: pd.Series, current_data: pd.Series) -> float:
+    """Compute the first Wasserstein distance between two samples, same as `scipy.stats.wasserstein_distance`.
+
+    Each sample is sorted on its own, so sorting their concatenation only has to merge two sorted runs.
+    """
+    reference = np.sort(np.asarray(reference_data, dtype=float))
+    current = np.sort(np.asarray(current_data, dtype=float))
+    if reference.size == 0 or current.size == 0:
+        raise ValueError("Distribution can't be empty.")
+    all_values = np.concatenate((reference, current))
+    # timsort detects the two sorted runs and merges them
+    all_values.sort(kind="mergesort")
+    deltas = np.diff(all_values)
+    reference_cdf = np.searchsorted(reference, all_values[:-1], "right") / reference.size
+    current_cdf = np.searchsorted(current, all_values[:-1], "right") / current.size
+    return np.sum(np.abs(reference_cdf - current_cdf) * deltas)
+
+
 def _wasserstein_distance_norm(
     reference_data: pd.Series, current_data: pd.Series, feature_type: str, threshold: float
 ) -> Tuple[float, bool]:
@@ -46,7 +63,7 @@ def _wasserstein_distance_norm(
         test_result: whether the drift is detected
     """
     norm = max(np.std(reference_data), 0.001)
-    wd_norm_value = stats.wasserstein_distance(reference_data, current_data) / norm
+    wd_norm_value = _wasserstein_distance(reference_data, current_data) / norm
     return wd_norm_value, wd_norm_value >= threshold
 
 
@@ -10,6 +10,7 @@ from evidently.base_metric import ColumnName
 from evidently.base_metric import InputData
 from evidently.base_metric import Metric
 from evidently.base_metric import MetricResult
+from evidently.calculations.data_quality import calculate_quantiles
 from evidently.core import ColumnType
 from evidently.metric_results import Distribution
 from evidently.model.widget import BaseWidgetInfo
@@ -62,13 +63,13 @@ class ColumnQuantileMetric(Metric[ColumnQuantileMetricResult]):
         if not pd.api.types.is_numeric_dtype(current_column.dtype):
             raise ValueError(f"Column '{self.column_name}' in current data is not numeric.")
 
-        current_quantile = current_column.quantile(self.quantile)
+        current_quantile = calculate_quantiles(current_column, [self.quantile])[0]
 
         if reference_column is not None:
             if not pd.api.types.is_numeric_dtype(reference_column.dtype):
                 raise ValueError(f"Column '{self.column_name}' in reference data is not numeric.")
 
-            reference_quantile = reference_column.quantile(self.quantile)
+            reference_quantile = calculate_quantiles(reference_column, [self.quantile])[0]
             reference_column = reference_column.replace([np.inf, -np.inf], np.nan)
 
         else:
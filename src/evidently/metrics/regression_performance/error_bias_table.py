@@ -255,11 +255,10 @@ class RegressionErrorBiasTableRenderer(MetricRenderer):
             ref_error = reference_data[prediction_name] - reference_data[target_name]
             current_error = current_data[prediction_name] - current_data[target_name]
 
-            ref_quantile_top = np.quantile(ref_error, obj.top_error)
-            ref_quantile_other = np.quantile(ref_error, 1 - obj.top_error)
-
-            current_quantile_top = np.quantile(current_error, obj.top_error)
-            current_quantile_other = np.quantile(current_error, 1 - obj.top_error)
+            ref_quantile_top, ref_quantile_other = np.quantile(ref_error, [obj.top_error, 1 - obj.top_error])
+            current_quantile_top, current_quantile_other = np.quantile(
+                current_error, [obj.top_error, 1 - obj.top_error]
+            )
 
             # create subplots
             reference_data["dataset"] = "Reference"
@@ -514,8 +513,7 @@ class RegressionErrorBiasTableRenderer(MetricRenderer):
         else:
             error = current_data[prediction_name] - current_data[target_name]
 
-            quantile_top = np.quantile(error, obj.top_error)
-            quantile_other = np.quantile(error, 1 - obj.top_error)
+            quantile_top, quantile_other = np.quantile(error, [obj.top_error, 1 - obj.top_error])
 
             current_data["Error bias"] = list(
                 map(
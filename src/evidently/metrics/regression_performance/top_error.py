@@ -64,8 +64,7 @@ class RegressionTopErrorMetric(Metric[RegressionTopErrorMetricResults]):
             raise ValueError("Expect one column for prediction. List of columns was provided.")
         curr_df = self._make_df_for_plot(curr_df, target_name, prediction_name, None)
         curr_error = curr_df[prediction_name] - curr_df[target_name]
-        quantile_5 = np.quantile(curr_error, 0.05)
-        quantile_95 = np.quantile(curr_error, 0.95)
+        quantile_5, quantile_95 = np.quantile(curr_error, [0.05, 0.95])
 
         curr_df["Error bias"] = list(
             map(
@@ -79,8 +78,7 @@ class RegressionTopErrorMetric(Metric[RegressionTopErrorMetricResults]):
         if ref_df is not None:
             ref_df = self._make_df_for_plot(ref_df.copy(), target_name, prediction_name, None)
             ref_error = ref_df[prediction_name] - ref_df[target_name]
-            quantile_5 = np.quantile(ref_error, 0.05)
-            quantile_95 = np.quantile(ref_error, 0.95)
+            quantile_5, quantile_95 = np.quantile(ref_error, [0.05, 0.95])
 
             ref_df["Error bias"] = list(
                 map(
@@ -4,6 +4,7 @@ from collections import defaultdict
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 import pandas as pd
@@ -18,6 +19,7 @@ from evidently.metric_preset.metric_preset import MetricPreset
 from evidently.metric_results import DatasetColumns
 from evidently.model.dashboard import DashboardInfo
 from evidently.model.widget import AdditionalGraphInfo
+from evidently.model.widget import BaseWidgetInfo
 from evidently.options.base import AnyOptions
 from evidently.options.base import Options
 from evidently.renderers.base_renderer import DetailsInfo
@@ -25,6 +27,7 @@ from evidently.suite.base_suite import ContextPayload
 from evidently.suite.base_suite import Display
 from evidently.suite.base_suite import Suite
 from evidently.suite.base_suite import find_metric_renderer
+from evidently.utils.dashboard import dataclass_to_dict
 from evidently.utils.data_operations import process_columns
 from evidently.utils.data_preprocessing import create_data_definition
 from evidently.utils.generators import BaseGenerator
@@ -34,6 +37,7 @@ class Report(Display):
     _inner_suite: Suite
     _columns_info: DatasetColumns
     _first_level_metrics: List[Union[Metric]]
+    _rendered_html: Optional[Tuple[List[BaseWidgetInfo], List[DetailsInfo]]]
     metrics: List[Union[Metric, MetricPreset, BaseGenerator]]
 
     def __init__(self, metrics: List[Union[Metric, MetricPreset, BaseGenerator]], options: AnyOptions = None):
@@ -42,6 +46,7 @@ class Report(Display):
         self.metrics = metrics
         self._inner_suite = Suite(self.options)
         self._first_level_metrics = []
+        self._rendered_html = None
 
     def run(
         self,
@@ -58,10 +63,13 @@ class Report(Display):
 
         self._columns_info = process_columns(current_data, column_mapping)
         self._inner_suite.reset()
+        self._first_level_metrics = []
+        self._rendered_html = None
         self._inner_suite.verify()
 
         data_definition = create_data_definition(reference_data, current_data, column_mapping)
         data = InputData(reference_data, current_data, None, None, column_mapping, data_definition)
+        has_presets = False
 
         # get each item from metrics/presets and add to metrics list
         # do it in one loop because we want to save metrics and presets order
@@ -78,6 +86,7 @@ class Report(Display):
                         raise ValueError(f"Incorrect metric type in generator {item}")
 
             elif isinstance(item, MetricPreset):
+                has_presets = True
                 metrics = []
 
                 for metric_item in item.generate_metrics(data=data, columns=self._columns_info):
@@ -98,7 +107,9 @@ class Report(Display):
             else:
                 raise ValueError("Incorrect item instead of a metric or metric preset was passed to Report")
 
-        data_definition = create_data_definition(reference_data, current_data, column_mapping)
+        if has_presets:
+            # presets can add columns to the datasets while generating metrics (e.g. predicted labels)
+            data_definition = create_data_definition(reference_data, current_data, column_mapping)
         curr_add, ref_add = self._inner_suite.create_additional_features(current_data, reference_data, data_definition)
         data = InputData(
             reference_data,
@@ -143,13 +154,13 @@ class Report(Display):
         metrics = defaultdict(list)
 
         for metric in self._first_level_metrics:
-            renderer = find_metric_renderer(type(metric), self._inner_suite.context.renderers)
             metric_id = metric.get_id()
             if group is not None and metric_id != group:
                 continue
+            renderer = find_metric_renderer(type(metric), self._inner_suite.context.renderers)
             metrics[metric_id].append(renderer.render_pandas(metric))
 
-        result = {cls: pd.concat(val) for cls, val in metrics.items()}
+        result = {cls: val[0] if len(val) == 1 else pd.concat(val, copy=False) for cls, val in metrics.items()}
         if group is None and len(result) == 1:
             return next(iter(result.values()))
         if group is None:
@@ -158,7 +169,11 @@ class Report(Display):
             raise ValueError(f"Metric group {group} not found in this report")
         return result[group]
 
-    def _build_dashboard_info(self):
+    def _render_html(self) -> Tuple[List[BaseWidgetInfo], List[DetailsInfo]]:
+        """Render html widgets of all metrics once per run, reused by show/save_html/_repr_html_"""
+        if self._rendered_html is not None:
+            return self._rendered_html
+
         metrics_results = []
         additional_graphs = []
 
@@ -180,11 +195,17 @@ class Report(Display):
 
             metrics_results.extend(html_info)
 
+        self._rendered_html = metrics_results, additional_graphs
+        return self._rendered_html
+
+    def _build_dashboard_info(self):
+        metrics_results, additional_graphs = self._render_html()
+
         return (
             "evidently_dashboard_" + str(uuid.uuid4()).replace("-", ""),
             DashboardInfo("Report", widgets=[result for result in metrics_results]),
             {
-                f"{item.id}": dataclasses.asdict(item.info) if dataclasses.is_dataclass(item.info) else item.info
+                f"{item.id}": dataclass_to_dict(item.info) if dataclasses.is_dataclass(item.info) else item.info
                 for item in additional_graphs
             },
         )
@@ -192,8 +213,12 @@ class Report(Display):
     def _get_payload(self) -> BaseModel:
         ctx = self._inner_suite.context
         suite = ContextPayload.from_context(ctx)
+        # payload metrics are listed in metric_results order, so positions can be taken from there by hash lookup
+        metric_positions = {metric: idx for idx, metric in enumerate(ctx.metric_results)}
         return _ReportPayload(
-            suite=suite, metrics_ids=[suite.metrics.index(m) for m in self._first_level_metrics], options=self.options
+            suite=suite,
+            metrics_ids=[metric_positions[m] for m in self._first_level_metrics],
+            options=self.options,
         )
 
     @classmethod
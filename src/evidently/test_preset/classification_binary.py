@@ -44,22 +44,16 @@ class BinaryClassificationTestPreset(TestPreset):
 
         if target is None:
             raise ValueError("Target column should be set in mapping and be present in data")
-        prediction_columns = data.data_definition.get_prediction_columns()
-        is_probas_present = prediction_columns is not None and prediction_columns.prediction_probas is not None
-        if not is_probas_present:
-            return [
-                TestColumnDrift(column_name=target, stattest=self.stattest, stattest_threshold=self.stattest_threshold),
-                TestPrecisionScore(probas_threshold=self.probas_threshold),
-                TestRecallScore(probas_threshold=self.probas_threshold),
-                TestF1Score(probas_threshold=self.probas_threshold),
-                TestAccuracyScore(probas_threshold=self.probas_threshold),
-            ]
-
-        return [
+        tests = [
             TestColumnDrift(column_name=target, stattest=self.stattest, stattest_threshold=self.stattest_threshold),
-            TestRocAuc(),
             TestPrecisionScore(probas_threshold=self.probas_threshold),
             TestRecallScore(probas_threshold=self.probas_threshold),
-            TestAccuracyScore(probas_threshold=self.probas_threshold),
             TestF1Score(probas_threshold=self.probas_threshold),
+            TestAccuracyScore(probas_threshold=self.probas_threshold),
         ]
+
+        prediction_columns = data.data_definition.get_prediction_columns()
+        if prediction_columns is None or prediction_columns.prediction_probas is None:
+            return tests
+
+        return [tests[0], TestRocAuc(), *tests[1:]]
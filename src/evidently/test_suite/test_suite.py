@@ -1,4 +1,3 @@
-import dataclasses
 import uuid
 from collections import Counter
 from typing import Dict
@@ -27,6 +26,7 @@ from evidently.test_preset.test_preset import TestPreset
 from evidently.tests.base_test import DEFAULT_GROUP
 from evidently.tests.base_test import Test
 from evidently.tests.base_test import TestStatus
+from evidently.utils.dashboard import dataclass_to_dict
 from evidently.utils.data_operations import process_columns
 from evidently.utils.data_preprocessing import create_data_definition
 from evidently.utils.generators import BaseGenerator
@@ -215,7 +215,7 @@ class TestSuite(Display):
         return (
             "evidently_dashboard_" + str(uuid.uuid4()).replace("-", ""),
             DashboardInfo("Test Suite", widgets=[summary_widget, test_suite_widget]),
-            {item.id: dataclasses.asdict(item.info) for idx, info in enumerate(test_results) for item in info.details},
+            {item.id: dataclass_to_dict(item.info) for idx, info in enumerate(test_results) for item in info.details},
         )
 
     def _get_payload(self) -> BaseModel:
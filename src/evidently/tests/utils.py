@@ -118,7 +118,8 @@ def plot_value_counts_tables(feature_name, values, curr_df, ref_df, id_prfx):
     additional_plots = []
     if values is not None:
         curr_df = curr_df[curr_df["count"] != 0]
-        curr_vals_inside_lst = curr_df[curr_df.x.isin(values)].sort_values("count", ascending=False)
+        inside_mask = curr_df.x.isin(values)
+        curr_vals_inside_lst = curr_df[inside_mask].sort_values("count", ascending=False)
         if curr_vals_inside_lst.shape[0] > 0:
             additional_plots.append(
                 DetailsInfo(
@@ -129,7 +130,7 @@ def plot_value_counts_tables(feature_name, values, curr_df, ref_df, id_prfx):
                     ),
                 )
             )
-        curr_vals_outside_lst = curr_df[~curr_df.x.isin(values)].sort_values("count", ascending=False)
+        curr_vals_outside_lst = curr_df[~inside_mask].sort_values("count", ascending=False)
         if curr_vals_outside_lst.shape[0] > 0:
             additional_plots.append(
                 DetailsInfo(
@@ -3,8 +3,8 @@ import dataclasses
 import json
 import os
 import shutil
-from dataclasses import asdict
 from enum import Enum
+from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -76,8 +76,29 @@ def save_data_file(filename: str, mode: SaveMode, dashboard_id, dashboard_info:
     return data_file
 
 
+def dataclass_to_dict(obj: Any) -> Any:
+    """Convert dataclasses to dicts like `dataclasses.asdict`, but without deep copying leaf values
+
+    Result is used only for json serialization, so leaf values can be shared with the source objects.
+    Containers are still rebuilt, so the result can be modified without touching the source.
+    """
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {field.name: dataclass_to_dict(getattr(obj, field.name)) for field in dataclasses.fields(obj)}
+    if isinstance(obj, tuple) and hasattr(obj, "_fields"):
+        return type(obj)(*[dataclass_to_dict(value) for value in obj])
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(dataclass_to_dict(value) for value in obj)
+    if isinstance(obj, dict):
+        if hasattr(type(obj), "default_factory"):
+            result = type(obj)(obj.default_factory)  # type: ignore[attr-defined]
+            result.update((key, dataclass_to_dict(value)) for key, value in obj.items())
+            return result
+        return type(obj)((key, dataclass_to_dict(value)) for key, value in obj.items())
+    return obj
+
+
 def dashboard_info_to_json(dashboard_info: DashboardInfo):
-    asdict_result = asdict(dashboard_info)
+    asdict_result = dataclass_to_dict(dashboard_info)
     for widget in asdict_result["widgets"]:
         widget.pop("additionalGraphs", None)
     return json.dumps(asdict_result, cls=NumpyEncoder)
@@ -127,6 +127,24 @@ def test_get_one_column_drift_success(
     assert result.drift_detected == expected_drift_detected
 
 
+def test_get_one_column_drift_categorical_small_distribution():
+    current_data = pd.DataFrame({"test": ["a", "b", "b", "d"]})
+    reference_data = pd.DataFrame({"test": ["a", "a", "c", "b"]})
+    result = get_one_column_drift(
+        current_data=current_data,
+        reference_data=reference_data,
+        column_name="test",
+        options=DataDriftOptions(),
+        dataset_columns=process_columns(reference_data, ColumnMapping()),
+        column_type="cat",
+        agg_data=False,
+    )
+    assert result.current.small_distribution.x == ["a", "b", "c", "d"]
+    assert result.current.small_distribution.y == [1, 2, 0, 1]
+    assert result.reference.small_distribution.x == ["a", "b", "c", "d"]
+    assert result.reference.small_distribution.y == [2, 1, 1, 0]
+
+
 @pytest.mark.parametrize(
     "current_data, reference_data, column_name, options, column_type, expected_value_error",
     (
@@ -4,6 +4,7 @@ import pytest
 
 from evidently.calculations.data_quality import calculate_column_distribution
 from evidently.calculations.data_quality import calculate_cramer_v_correlation
+from evidently.calculations.data_quality import calculate_quantiles
 from evidently.calculations.data_quality import get_rows_count
 from evidently.metric_results import ColumnCorrelations
 from evidently.metric_results import Distribution
@@ -52,3 +53,28 @@ def test_calculate_cramer_v_correlations():
             y=[1.0, 1.0, 1.0],
         ),
     )
+
+
+@pytest.mark.parametrize(
+    "column, quantiles",
+    (
+        (pd.Series([1, 2, 3, 4]), [0.5]),
+        (pd.Series([5, 1, 4, 2, 3]), [0.1, 0.25, 0.5, 0.75, 1]),
+        (pd.Series([1.5, np.nan, -3, 8, np.nan, 2]), [0.3, 0.9]),
+        (pd.Series([1, 2, None], dtype="Int64"), [0.5]),
+        (pd.Series([np.inf, 1, 2]), [0.2, 0.5]),
+        (pd.Series([7.0]), [0.5, 1]),
+    ),
+)
+def test_calculate_quantiles(column: pd.Series, quantiles: list) -> None:
+    assert calculate_quantiles(column, quantiles) == pytest.approx([column.quantile(q) for q in quantiles], nan_ok=True)
+
+
+def test_calculate_quantiles_empty() -> None:
+    assert all(np.isnan(value) for value in calculate_quantiles(pd.Series([], dtype=float), [0.5, 0.9]))
+
+
+@pytest.mark.parametrize("quantiles", ([-0.1], [1.5], [0.5, 1.5]))
+def test_calculate_quantiles_out_of_range(quantiles: list) -> None:
+    with pytest.raises(ValueError, match="interval"):
+        calculate_quantiles(pd.Series([1, 2, 3]), quantiles)
@@ -8,9 +8,12 @@ from evidently.base_metric import InputData
 from evidently.base_metric import Metric
 from evidently.base_metric import MetricResult
 from evidently.metric_results import Distribution
+from evidently.metrics import ColumnQuantileMetric
+from evidently.model.widget import AdditionalGraphInfo
 from evidently.model.widget import BaseWidgetInfo
 from evidently.renderers.base_renderer import MetricRenderer
 from evidently.renderers.base_renderer import default_renderer
+from evidently.renderers.html_widgets import header_text
 from evidently.report import Report
 
 
@@ -59,3 +62,81 @@ def test_json(report: Report):
 
     include_series = json.loads(report.json(include={"MockMetric": {"value", "series"}}))["metrics"]
     assert include_series == [{"metric": "MockMetric", "result": {"value": "a", "series": [0]}}]
+
+
+def test_rerun_keeps_metrics(report: Report):
+    report.run(reference_data=pd.DataFrame(), current_data=pd.DataFrame())
+    assert report.as_dict() == {"metrics": [{"metric": "MockMetric", "result": {"value": "a"}}]}
+
+
+class CountingMetric(Metric[MockMetricResult]):
+    def calculate(self, data: InputData) -> MockMetricResult:
+        return MockMetricResult(value="a", series=pd.Series([0]), distribution=Distribution(x=[1, 1], y=[0, 0]))
+
+
+@default_renderer(wrap_type=CountingMetric)
+class CountingMetricRenderer(MetricRenderer):
+    calls = 0
+
+    def render_html(self, obj) -> List[BaseWidgetInfo]:
+        CountingMetricRenderer.calls += 1
+        return [header_text(label="counting")]
+
+
+def test_html_rendered_once_per_run():
+    report = Report(metrics=[CountingMetric()])
+    report.run(reference_data=pd.DataFrame(), current_data=pd.DataFrame())
+    CountingMetricRenderer.calls = 0
+
+    first_id, first_info, _ = report._build_dashboard_info()
+    second_id, second_info, _ = report._build_dashboard_info()
+    assert CountingMetricRenderer.calls == 1
+    assert first_id != second_id
+    assert first_info.widgets == second_info.widgets
+
+    report.run(reference_data=pd.DataFrame(), current_data=pd.DataFrame())
+    assert report._rendered_html is None
+
+
+class GraphMetric(Metric[MockMetricResult]):
+    def calculate(self, data: InputData) -> MockMetricResult:
+        return MockMetricResult(value="a", series=pd.Series([0]), distribution=Distribution(x=[1, 1], y=[0, 0]))
+
+
+GRAPH_PARAMS = {"data": [{"x": [1.0, 2.0], "y": [3.0, 4.0]}], "layout": {}}
+
+
+@default_renderer(wrap_type=GraphMetric)
+class GraphMetricRenderer(MetricRenderer):
+    def render_html(self, obj) -> List[BaseWidgetInfo]:
+        widget = header_text(label="graph")
+        widget.additionalGraphs = [AdditionalGraphInfo(id="graph", params=GRAPH_PARAMS)]
+        return [widget]
+
+
+def test_additional_graph_params_passed_through():
+    report = Report(metrics=[GraphMetric()])
+    report.run(reference_data=pd.DataFrame(), current_data=pd.DataFrame())
+
+    _, _, additional_graphs = report._build_dashboard_info()
+    assert additional_graphs["graph"] is GRAPH_PARAMS
+
+
+def test_as_pandas_groups():
+    data = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [4.0, 5.0, 6.0]})
+    report = Report(metrics=[ColumnQuantileMetric(column_name="a", quantile=0.5)])
+    report.run(reference_data=None, current_data=data)
+    single = report.as_pandas()
+    assert list(single.index) == ["a"]
+
+    report = Report(
+        metrics=[
+            ColumnQuantileMetric(column_name="a", quantile=0.5),
+            ColumnQuantileMetric(column_name="b", quantile=0.5),
+        ]
+    )
+    report.run(reference_data=None, current_data=data)
+    grouped = report.as_pandas("ColumnQuantileMetric")
+    assert list(grouped.index) == ["a", "b"]
+    with pytest.raises(ValueError):
+        report.as_pandas("UnknownMetric")
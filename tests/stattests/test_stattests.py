@@ -17,6 +17,7 @@ from evidently.calculations.stattests.mann_whitney_urank_stattest import mann_wh
 from evidently.calculations.stattests.mmd_stattest import emperical_mmd
 from evidently.calculations.stattests.t_test import t_test
 from evidently.calculations.stattests.tvd_stattest import tvd_test
+from evidently.calculations.stattests.wasserstein_distance_norm import _wasserstein_distance
 
 
 def test_freq_obs_eq_freq_exp() -> None:
@@ -325,3 +326,25 @@ def test_t_test() -> None:
     reference = pd.Series([38.7, 41.5, 43.8, 44.5, 45.5, 46.0, 47.7, 58.0])
     current = pd.Series([39.2, 39.3, 39.7, 41.4, 41.8, 42.9, 43.3, 45.8])
     assert t_test.func(reference, current, "num", 0.05) == (approx(0.084, abs=1e-3), False)
+
+
+@pytest.mark.parametrize(
+    "reference, current",
+    (
+        ([1, 2, 3, 4, 5], [1, 2, 3, 4, 5]),
+        ([0, 1, 3], [5, 6, 8]),
+        ([3.4, 3.9, 7.5, 7.8, 1.0], [4.5, 1.4]),
+        (np.random.RandomState(0).normal(size=1000), np.random.RandomState(1).normal(1, 2, size=100)),
+        ([], [1.0]),
+        ([1.0], []),
+        ([], []),
+    ),
+)
+def test_wasserstein_distance(reference, current) -> None:
+    reference = pd.Series(reference, dtype=float)
+    current = pd.Series(current, dtype=float)
+    if reference.empty or current.empty:
+        with pytest.raises(ValueError, match="Distribution can't be empty."):
+            _wasserstein_distance(reference, current)
+        return
+    assert _wasserstein_distance(reference, current) == approx(stats.wasserstein_distance(reference, current))
@@ -0,0 +1,36 @@
+import pandas as pd
+
+from evidently import ColumnMapping
+from evidently.test_preset import BinaryClassificationTestPreset
+from evidently.test_suite import TestSuite
+
+
+def test_binary_classification_preset_labels():
+    current = pd.DataFrame({"target": [1, 1, 0, 1], "prediction": [0, 1, 1, 1]})
+    reference = pd.DataFrame({"target": [0, 0, 0, 1], "prediction": [0, 0, 1, 1]})
+    suite = TestSuite(tests=[BinaryClassificationTestPreset()])
+
+    suite.run(current_data=current, reference_data=reference)
+    assert [test["name"] for test in suite.as_dict()["tests"]] == [
+        "Drift per Column",
+        "Precision Score",
+        "Recall Score",
+        "F1 Score",
+        "Accuracy Score",
+    ]
+
+
+def test_binary_classification_preset_probas():
+    current = pd.DataFrame({"target": [1, 1, 0, 1], "prediction": [0.1, 0.8, 0.7, 0.9]})
+    reference = pd.DataFrame({"target": [0, 0, 0, 1], "prediction": [0.2, 0.3, 0.6, 0.8]})
+    suite = TestSuite(tests=[BinaryClassificationTestPreset(probas_threshold=0.5)])
+
+    suite.run(current_data=current, reference_data=reference, column_mapping=ColumnMapping(pos_label=1))
+    assert [test["name"] for test in suite.as_dict()["tests"]] == [
+        "Drift per Column",
+        "ROC AUC Score",
+        "Precision Score",
+        "Recall Score",
+        "F1 Score",
+        "Accuracy Score",
+    ]
@@ -0,0 +1,33 @@
+import dataclasses
+
+import numpy as np
+
+from evidently.model.widget import AdditionalGraphInfo
+from evidently.model.widget import BaseWidgetInfo
+from evidently.model.widget import Insight
+from evidently.utils.dashboard import dataclass_to_dict
+
+
+def test_dataclass_to_dict_matches_asdict():
+    widget = BaseWidgetInfo(
+        type="counter",
+        title="title",
+        size=2,
+        params={"counters": [{"value": "1", "label": "Tests"}]},
+        insights=[Insight(title="insight", severity="info", text="text")],
+        additionalGraphs=[AdditionalGraphInfo(id="graph", params={"data": [1, 2]})],
+        widgets=[BaseWidgetInfo(type="text", title="", size=1, params={"text": "nested"})],
+    )
+
+    assert dataclass_to_dict(widget) == dataclasses.asdict(widget)
+
+
+def test_dataclass_to_dict_shares_leaf_values():
+    data = np.array([1.0, 2.0])
+    widget = BaseWidgetInfo(type="big_graph", title="", size=2, params={"data": data})
+
+    result = dataclass_to_dict(widget)
+
+    assert result["params"]["data"] is data
+    result["params"].pop("data")
+    assert widget.params == {"data": data}